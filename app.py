@@ -6,7 +6,10 @@ Entry point for Arcaload
 import os
 from flask import Flask, render_template, session
 from config import active_config
-from models import db, Admin, Game, GameRequest
+from models import db, Admin, Game, GameRequest, GameChange, ensure_indexes
+from cache import game_cache
+from events import broker
+from queryplan import register_commands
 from datetime import timedelta
 
 def create_app(config=None):
@@ -48,10 +51,19 @@ def create_app(config=None):
     # Initialize database
     db.init_app(app)
     
+    # Initialize game detail cache
+    game_cache.init_app(app)
+    
+    # Initialize live dashboard events
+    broker.init_app(app)
+    
     # Register blueprints
     from routes import register_blueprints
     register_blueprints(app)
     
+    # Register CLI commands
+    register_commands(app)
+    
     # Error handlers
     @app.errorhandler(404)
     def not_found_error(error):
@@ -81,6 +93,8 @@ def create_app(config=None):
     # Create database tables
     with app.app_context():
         db.create_all()
+        # Add indexes declared after a table was first created
+        ensure_indexes()
         
         # Create default admin if not exists
         if Admin.query.first() is None:
@@ -91,6 +105,15 @@ def create_app(config=None):
             db.session.add(admin)
             db.session.commit()
             print("✓ Default admin user created")
+        
+        # Seed the change feed for catalogues created before it existed
+        if GameChange.query.first() is None and Game.query.first() is not None:
+            db.session.execute(GameChange.__table__.insert().from_select(
+                ['game_id', 'operation', 'created_at'],
+                db.select(Game.id, db.literal('insert'), Game.created_at).order_by(Game.id)
+            ))
+            db.session.commit()
+            print("✓ Change feed seeded from existing games")
     
     return app
 
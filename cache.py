@@ -0,0 +1,125 @@
+"""
+Read-through LRU cache for game detail payloads
+Static fields are cached per game id; download counts are tracked separately
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from models import db, Game
+
+
+class GameCache:
+    """Bounded LRU + TTL cache of serialised games keyed by id
+
+    Missing ids are cached as negative entries with their own (shorter) TTL.
+    The cache is per process: writes in this process invalidate it directly,
+    writes elsewhere become visible once the entry expires.
+
+    Loads run outside the lock. A load is only stored if no invalidation
+    happened while it ran, so a payload read before a concurrent update
+    commits is never cached over it.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, max_size=1024, ttl=60, negative_ttl=10):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # game_id -> [expires_at, static payload, downloads]
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._generation = 0  # bumped by every invalidation
+
+    def init_app(self, app):
+        """Size the cache from app config"""
+        self.max_size = app.config['GAME_CACHE_SIZE']
+        self.ttl = app.config['GAME_CACHE_TTL']
+        self.negative_ttl = app.config['GAME_CACHE_NEGATIVE_TTL']
+        self.clear()
+
+    def get(self, game_id, loader):
+        """Return the payload for game_id, calling loader() on a miss
+
+        loader returns a to_dict() payload or None if the game does not exist.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(game_id)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(game_id)
+                self._hits += 1
+                return self._merge(entry)
+            self._misses += 1
+            generation = self._generation
+
+        payload = loader()
+
+        with self._lock:
+            if generation != self._generation:
+                # Invalidated while loading; serve the load but don't cache it
+                return payload
+            if payload is None:
+                entry = [now + self.negative_ttl, self._MISSING, None]
+            else:
+                static = dict(payload)
+                entry = [now + self.ttl, static, static.pop('downloads')]
+            self._entries[game_id] = entry
+            self._entries.move_to_end(game_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+            return self._merge(entry)
+
+    def set_downloads(self, game_id, downloads):
+        """Apply a fresh download count without touching the static fields"""
+        with self._lock:
+            entry = self._entries.get(game_id)
+            if entry is None or entry[0] <= time.monotonic():
+                # A load in flight may have read the old count
+                self._generation += 1
+            if entry is not None and entry[1] is not self._MISSING:
+                # Concurrent increments can report out of order; counts only grow
+                entry[2] = max(entry[2], downloads)
+
+    def invalidate(self, game_id):
+        with self._lock:
+            self._entries.pop(game_id, None)
+            self._generation += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'hit_rate': round(self._hits / lookups, 4) if lookups else 0.0
+            }
+
+    def _merge(self, entry):
+        if entry[1] is self._MISSING:
+            return None
+        return {**entry[1], 'downloads': entry[2]}
+
+
+def get_game_payload(game_id):
+    """Cached to_dict() of a game, or None if it does not exist"""
+    def load():
+        game = db.session.get(Game, game_id)
+        return game.to_dict() if game is not None else None
+    return game_cache.get(game_id, load)
+
+
+game_cache = GameCache()
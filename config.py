@@ -34,6 +34,21 @@ class Config:
     # CSRF Protection
     WTF_CSRF_ENABLED = True
     WTF_CSRF_TIME_LIMIT = None
+    
+    # Live admin dashboard (Server-Sent Events)
+    # The event buffer lives in process memory, so live updates need a single
+    # worker process (see Procfile); scale with threads, not workers
+    ADMIN_EVENTS_HEARTBEAT = 15  # seconds between keep-alive comments
+    ADMIN_EVENTS_MAX_AGE = 300  # seconds before a stream is closed and the browser reconnects
+    ADMIN_EVENTS_MAX_SUBSCRIBERS = 4  # keep gunicorn threads free for regular requests
+    ADMIN_EVENTS_RETRY = 2  # seconds the browser waits before reconnecting
+    ADMIN_EVENTS_BUFFER = 500  # recent events kept for Last-Event-ID replay
+    ADMIN_EVENTS_COALESCE = 1.0  # seconds download-count deltas are merged over
+    
+    # Game detail cache
+    GAME_CACHE_SIZE = 1024  # max cached games per process
+    GAME_CACHE_TTL = 60  # seconds before a cached game is reloaded
+    GAME_CACHE_NEGATIVE_TTL = 10  # seconds a missing game id stays cached
 
 
 class DevelopmentConfig(Config):
@@ -0,0 +1,140 @@
+"""
+In-process pub/sub for live admin dashboard updates
+Write paths publish events, the admin SSE stream consumes them
+"""
+
+import json
+import threading
+import time
+import uuid
+from collections import deque
+
+
+class EventBroker:
+    """Sequenced ring buffer of dashboard events for this process
+
+    Every event gets a sequence number and stays in the buffer until it is
+    pushed out, so a reconnecting stream replays what it missed from its
+    Last-Event-ID. Download-count deltas are coalesced per admin and game
+    and published at most once per coalesce interval.
+    """
+
+    def __init__(self, buffer_size=500, coalesce_interval=1.0):
+        # Sequence numbers restart with the process; the epoch tells them apart
+        self.epoch = uuid.uuid4().hex[:8]
+        self.coalesce_interval = coalesce_interval
+        self._condition = threading.Condition()
+        self._events = deque(maxlen=buffer_size)  # (seq, event, data, admin_id)
+        self._seq = 0
+        self._pending_downloads = {}  # admin_id -> {game_id: [delta, downloads]}
+        self._last_flush = 0.0
+        self._subscribers = 0
+
+    def init_app(self, app):
+        """Size the buffer from app config"""
+        with self._condition:
+            self._events = deque(self._events, maxlen=app.config['ADMIN_EVENTS_BUFFER'])
+            self.coalesce_interval = app.config['ADMIN_EVENTS_COALESCE']
+
+    def subscribe(self, max_subscribers):
+        """Reserve a stream slot; False when max_subscribers are connected"""
+        with self._condition:
+            if self._subscribers >= max_subscribers:
+                return False
+            self._subscribers += 1
+            return True
+
+    def unsubscribe(self):
+        with self._condition:
+            self._subscribers -= 1
+
+    def cursor(self):
+        """Event id of the latest event, for resuming after it"""
+        with self._condition:
+            return self.event_id(self._seq)
+
+    def event_id(self, seq):
+        return f'{self.epoch}-{seq}'
+
+    def parse_event_id(self, event_id):
+        """Sequence number of an event id, or None if it is not from this process"""
+        epoch, _, seq = (event_id or '').partition('-')
+        with self._condition:
+            if epoch != self.epoch or not (seq.isascii() and seq.isdigit()) or int(seq) > self._seq:
+                return None
+        return int(seq)
+
+    def publish(self, event, data, admin_id=None):
+        """Send an event to every connected admin, or only to admin_id"""
+        with self._condition:
+            self._append(event, data, admin_id)
+
+    def publish_downloads(self, game_id, admin_id, downloads, delta=1):
+        """Record a download-count change for the admin owning the game"""
+        with self._condition:
+            games = self._pending_downloads.setdefault(admin_id, {})
+            pending = games.setdefault(game_id, [0, downloads])
+            pending[0] += delta
+            pending[1] = max(pending[1], downloads)
+            self._flush_downloads()
+
+    def events_after(self, seq, admin_id, timeout):
+        """Wait up to timeout seconds for events after seq
+
+        Returns (events, last_seq, gap): events visible to admin_id as
+        (seq, event, data), the sequence number to resume from, and whether
+        events after seq were already pushed out of the buffer.
+        """
+        with self._condition:
+            self._flush_downloads()
+            if self._seq <= seq:
+                wait = min(timeout, self.coalesce_interval) if self._pending_downloads else timeout
+                self._condition.wait(wait)
+                self._flush_downloads()
+
+            oldest = self._events[0][0] if self._events else self._seq + 1
+            gap = seq < oldest - 1
+            events = [
+                (event_seq, event, data)
+                for event_seq, event, data, target in self._events
+                if event_seq > seq and target in (None, admin_id)
+            ]
+            return events, self._seq, gap
+
+    def _append(self, event, data, admin_id):
+        self._seq += 1
+        self._events.append((self._seq, event, data, admin_id))
+        self._condition.notify_all()
+
+    def _flush_downloads(self):
+        now = time.monotonic()
+        if not self._pending_downloads or now - self._last_flush < self.coalesce_interval:
+            return
+        for admin_id, games in self._pending_downloads.items():
+            self._append('downloads', {
+                'games': [
+                    {'id': game_id, 'delta': delta, 'downloads': downloads}
+                    for game_id, (delta, downloads) in games.items()
+                ]
+            }, admin_id)
+        self._pending_downloads = {}
+        self._last_flush = now
+
+
+def format_sse(event=None, data=None, event_id=None, comment=None, retry=None):
+    """Encode a single Server-Sent Events message"""
+    lines = []
+    if comment is not None:
+        lines.append(f': {comment}')
+    if retry is not None:
+        lines.append(f'retry: {retry}')
+    if event_id is not None:
+        lines.append(f'id: {event_id}')
+    if event is not None:
+        lines.append(f'event: {event}')
+    if data is not None:
+        lines.append(f'data: {json.dumps(data)}')
+    return '\n'.join(lines) + '\n\n'
+
+
+broker = EventBroker()
@@ -1,10 +1,12 @@
 """
 Database models for Arcaload
-Admin, Game, and GameRequest models
+Admin, Game, GameRequest and GameChange models
 """
 
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import event, inspect
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.orm import DeclarativeBase, Session
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime
 
@@ -15,6 +17,9 @@ class Base(DeclarativeBase):
 
 db = SQLAlchemy(model_class=Base)
 
+# Advisory lock serialising change feed writers on PostgreSQL
+CHANGE_FEED_LOCK_KEY = 0x4172636c  # 'Arcl'
+
 
 class Admin(db.Model):
     """Admin user model"""
@@ -44,6 +49,11 @@ class Admin(db.Model):
 class Game(db.Model):
     """Game model"""
     __tablename__ = 'games'
+    __table_args__ = (
+        db.Index('ix_games_genre_created_at', 'genre', 'created_at'),
+        db.Index('ix_games_admin_id_created_at', 'admin_id', 'created_at'),
+        db.Index('ix_games_title_lower', db.func.lower(db.text('title'))),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False, index=True)
@@ -53,7 +63,7 @@ class Game(db.Model):
     download_link = db.Column(db.String(500), nullable=False)
     downloads = db.Column(db.Integer, default=0)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     
     # Foreign key
     admin_id = db.Column(db.Integer, db.ForeignKey('admin.id'), nullable=False)
@@ -78,6 +88,10 @@ class Game(db.Model):
 class GameRequest(db.Model):
     """Game request model for user-requested games"""
     __tablename__ = 'game_requests'
+    __table_args__ = (
+        db.Index('ix_game_requests_status_created_at', 'status', 'created_at'),
+        db.Index('ix_game_requests_game_title_lower', db.func.lower(db.text('game_title'))),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     game_title = db.Column(db.String(200), nullable=False, index=True)
@@ -97,4 +111,106 @@ class GameRequest(db.Model):
             'user_email': self.user_email,
             'status': self.status,
             'created_at': self.created_at.isoformat()
-        }
\ No newline at end of file
+        }
+
+
+class GameChange(db.Model):
+    """Change feed entry for the games catalogue
+    
+    The id doubles as a monotonic sequence number. Only the latest change
+    per game is kept, so deleted games leave a single tombstone row and the
+    feed grows with churn rather than with every write. Download counts are
+    not catalogue changes and are never logged.
+    
+    Sequence numbers become visible in commit order: writers serialise on
+    the changelog (see log_game_changes), so a reader that has seen seq N
+    will never later find a committed change below N.
+    """
+    __tablename__ = 'game_changes'
+    # AUTOINCREMENT stops SQLite from reusing the sequence of a compacted row
+    __table_args__ = {'sqlite_autoincrement': True}
+    
+    id = db.Column(db.Integer, primary_key=True)
+    game_id = db.Column(db.Integer, nullable=False, index=True)
+    operation = db.Column(db.String(10), nullable=False)  # insert, update, delete
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<GameChange {self.id} {self.operation} game={self.game_id}>'
+    
+    def to_dict(self, game=None):
+        """Convert to dictionary, embedding the current game for upserts"""
+        return {
+            'seq': self.id,
+            'op': self.operation,
+            'game_id': self.game_id,
+            'game': game.to_dict() if game is not None else None,
+            'changed_at': self.created_at.isoformat()
+        }
+
+
+def ensure_indexes():
+    """Create declared indexes missing from existing tables
+    
+    db.create_all() only creates indexes together with a new table, so
+    indexes added to a model later are applied here. IF NOT EXISTS is used
+    because expression indexes are not reflected by every dialect.
+    """
+    with db.engine.begin() as connection:
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                connection.execute(CreateIndex(index, if_not_exists=True))
+
+
+@event.listens_for(Session, 'after_flush')
+def record_game_changes(session, flush_context):
+    """Append changelog rows for every Game written in this flush"""
+    changes = []
+    for obj in session.new:
+        if isinstance(obj, Game):
+            changes.append((obj.id, 'insert'))
+    for obj in session.dirty:
+        if isinstance(obj, Game) and _catalogue_fields_changed(obj):
+            changes.append((obj.id, 'update'))
+    for obj in session.deleted:
+        if isinstance(obj, Game):
+            changes.append((obj.id, 'delete'))
+    
+    if changes:
+        # Write through the flush connection; the ORM unit of work is closed here
+        log_game_changes(session.connection(), changes)
+
+
+def _catalogue_fields_changed(game):
+    """Whether a flush changes anything but the download counter"""
+    changed = {
+        attr.key for attr in inspect(game).attrs
+        if attr.history.has_changes()
+    }
+    return bool(changed - {'downloads', 'updated_at'})
+
+
+def log_game_changes(connection, changes):
+    """Replace the changelog rows of the given (game_id, operation) pairs
+    
+    Writes that bypass the ORM unit of work (bulk UPDATE statements) must
+    call this themselves to show up in the change feed.
+    
+    The sequence is taken under a transaction-scoped lock held until commit,
+    so a higher seq can never commit before a lower one. SQLite already
+    holds its single writer lock from the first write to commit.
+    """
+    if connection.dialect.name == 'postgresql':
+        connection.execute(
+            db.text('SELECT pg_advisory_xact_lock(:key)'), {'key': CHANGE_FEED_LOCK_KEY}
+        )
+    
+    table = GameChange.__table__
+    connection.execute(
+        table.delete().where(table.c.game_id.in_([game_id for game_id, _ in changes]))
+    )
+    now = datetime.utcnow()
+    connection.execute(table.insert(), [
+        {'game_id': game_id, 'operation': operation, 'created_at': now}
+        for game_id, operation in changes
+    ])
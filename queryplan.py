@@ -0,0 +1,364 @@
+"""
+Query-plan checks for the data layer
+Replays every route against a seeded SQLite database and inspects
+EXPLAIN QUERY PLAN for each query it issues
+"""
+
+import re
+import sys
+from datetime import datetime, timedelta
+
+import click
+from flask import session
+from sqlalchemy import event, inspect
+from werkzeug.exceptions import HTTPException
+
+from config import TestingConfig
+from models import db, Admin, Game, GameRequest
+
+
+class QueryPlanConfig(TestingConfig):
+    """Seeded in-memory database with the game cache disabled"""
+    GAME_CACHE_TTL = 0
+    GAME_CACHE_NEGATIVE_TTL = 0
+
+
+# (endpoint, method, path, view args, request kwargs) replayed by the checker.
+# Views are dispatched by endpoint so routes shadowed by another blueprint's
+# URL rule are still covered.
+ROUTE_CALLS = [
+    ('main.index', 'GET', '/', {}, {}),
+    ('main.search', 'GET', '/search', {}, {'query_string': {'q': 'quest'}}),
+    ('main.get_game', 'GET', '/games/7', {'game_id': 7}, {}),
+    ('main.request_game', 'POST', '/request-game', {}, {'json': {'game_title': 'Brand New Game'}}),
+    ('main.get_stats', 'GET', '/api/stats', {}, {}),
+    ('admin.login', 'POST', '/admin/login', {}, {'data': {'username': 'planner0', 'password': 'planner'}}),
+    ('admin.dashboard', 'GET', '/admin/dashboard', {}, {}),
+    ('admin.add_game', 'POST', '/admin/api/game/add', {}, {'json': {
+        'title': 'Another Game', 'description': 'Description', 'genre': 'Action',
+        'cover_image_url': 'https://example.com/cover.png',
+        'download_link': 'https://example.com/download'
+    }}),
+    ('admin.update_game', 'PUT', '/admin/api/game/1/update', {'game_id': 1}, {'json': {'genre': 'Puzzle'}}),
+    ('admin.delete_game', 'DELETE', '/admin/api/game/4/delete', {'game_id': 4}, {}),
+    ('admin.update_request', 'PUT', '/admin/api/request/3/update', {'request_id': 3}, {'json': {'status': 'added'}}),
+    ('api.get_games', 'GET', '/api/games', {}, {'query_string': {'genre': 'Action'}}),
+    ('api.get_game_changes', 'GET', '/api/games/changes', {}, {'query_string': {'since': 50}}),
+    ('api.get_game_detail', 'GET', '/api/games/7', {'game_id': 7}, {}),
+    ('api.get_genres', 'GET', '/api/genres', {}, {}),
+    ('api.get_requests', 'GET', '/api/requests', {}, {'query_string': {'status': 'pending'}}),
+    ('api.search_games', 'GET', '/api/search', {}, {'query_string': {'q': 'quest'}}),
+    ('api.get_stats', 'GET', '/api/stats', {}, {}),
+]
+
+# Endpoints that run no database queries, so they need no ROUTE_CALLS entry
+NO_QUERY_ENDPOINTS = {'static', 'admin.logout', 'admin.events', 'admin.cache_stats'}
+
+# Full scans that no index can remove: (endpoint, statement regex) -> reason.
+# The regex must match the whole whitespace-normalised statement, so a new
+# scan in the same view still fails the check.
+FULL_SCAN_ALLOWED = {
+    ('main.search', r'SELECT [\w., ]+ FROM games WHERE lower\(games\.title\) LIKE lower\(\?\) '
+                    r'OR lower\(games\.description\) LIKE lower\(\?\) LIMIT \? OFFSET \?'):
+        'substring match (LIKE %q%) cannot use a b-tree index',
+    ('api.search_games', r'SELECT [\w., ]+ FROM games WHERE lower\(games\.title\) LIKE lower\(\?\) '
+                         r'OR lower\(games\.description\) LIKE lower\(\?\) '
+                         r'OR lower\(games\.genre\) LIKE lower\(\?\) LIMIT \? OFFSET \?'):
+        'substring match (LIKE %q%) cannot use a b-tree index',
+    ('api.get_stats', r'SELECT sum\(games\.downloads\) AS sum_1 FROM games'):
+        'platform-wide SUM(downloads) reads every game',
+}
+
+# The advisor must suggest this index for api.get_games when it is dropped
+ADVISOR_SELF_TEST = ('ix_games_genre_created_at', ('games', ('genre', 'created_at')))
+
+GENRES = ['Action', 'Adventure', 'Puzzle', 'RPG', 'Strategy', 'Racing', 'Sports', 'Horror']
+STATUSES = ['pending', 'added', 'rejected']
+
+_SCAN = re.compile(r'^SCAN (?:TABLE )?(\w+)(?: AS \w+)?(?: USING (?:COVERING )?INDEX \w+)?$')
+_EQUALITY = re.compile(r'(lower\()?(\w+)\.(\w+)\)? = ')
+_ORDER_BY = re.compile(r'ORDER BY (\w+)\.(\w+)')
+
+
+def seed_database(games=400, requests=200):
+    """Fill the current database with a realistic spread of rows
+
+    Returns the id of the admin owning games 1, 4, 7, ...
+    """
+    admins = []
+    for i in range(3):
+        admin = Admin(username=f'planner{i}', email=f'planner{i}@arcaload.com')
+        admin.set_password('planner')
+        admins.append(admin)
+    db.session.add_all(admins)
+    db.session.flush()
+
+    start = datetime.utcnow() - timedelta(days=games)
+    db.session.add_all([
+        Game(
+            title=f'Quest {i}' if i % 10 == 0 else f'Game {i}',
+            description=f'Description of game {i}',
+            genre=GENRES[i % len(GENRES)],
+            cover_image_url=f'https://example.com/{i}.png',
+            download_link=f'https://example.com/{i}',
+            downloads=i * 3,
+            created_at=start + timedelta(days=i),
+            admin_id=admins[i % len(admins)].id
+        )
+        for i in range(games)
+    ])
+    db.session.add_all([
+        GameRequest(
+            game_title=f'Requested {i}',
+            status=STATUSES[i % len(STATUSES)],
+            created_at=start + timedelta(days=i)
+        )
+        for i in range(requests)
+    ])
+    db.session.commit()
+    db.session.execute(db.text('ANALYZE'))
+    db.session.commit()
+    return admins[0].id
+
+
+def capture_route_queries(app, admin_id):
+    """Replay ROUTE_CALLS and return [(endpoint, statement, parameters)]"""
+    captured = []
+    current = {}
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        verb = statement.lstrip().split(None, 1)[0].upper()
+        if verb in ('SELECT', 'UPDATE', 'DELETE') and not executemany:
+            captured.append((current['endpoint'], statement, parameters))
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        for endpoint, method, path, view_args, kwargs in ROUTE_CALLS:
+            current['endpoint'] = endpoint
+            with app.test_request_context(path, method=method, **kwargs):
+                if endpoint.startswith('admin.') and endpoint != 'admin.login':
+                    session['admin_id'] = admin_id
+                try:
+                    app.view_functions[endpoint](**view_args)
+                except HTTPException:
+                    pass
+                db.session.rollback()
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+    return captured
+
+
+def explain(statement, parameters):
+    """Return the EXPLAIN QUERY PLAN detail lines of a statement"""
+    rows = db.session.connection().exec_driver_sql(
+        f'EXPLAIN QUERY PLAN {statement}', parameters
+    ).all()
+    return [row[3] for row in rows]
+
+
+def equality_columns(statement, table):
+    """Columns of table compared with = in a statement, lower() kept"""
+    columns = []
+    for lowered, name, column in _EQUALITY.findall(statement):
+        if name == table:
+            column = f'lower({column})' if lowered else column
+            if column not in columns:
+                columns.append(column)
+    return columns
+
+
+def full_scans(statement, plan):
+    """Tables a plan reads end to end
+
+    Covers plain scans, and index scans that only supply ordering while
+    the rows are still filtered one by one.
+    """
+    tables = set(db.metadata.tables)
+    scans = []
+    for detail in plan:
+        match = _SCAN.match(detail)
+        if not match or match.group(1) not in tables:
+            continue
+        table = match.group(1)
+        if 'INDEX' not in detail or equality_columns(statement, table):
+            scans.append(table)
+    return scans
+
+
+def suggest_index(statement, table):
+    """Suggest a composite index from equality filters then ordering on table"""
+    columns = equality_columns(statement, table)
+    for name, column in _ORDER_BY.findall(statement):
+        if name == table and column not in columns:
+            columns.append(column)
+    return tuple(columns)
+
+
+def allowed_reason(endpoint, statement):
+    """Why a full scan in this statement is accepted, or None"""
+    for (allowed_endpoint, pattern), reason in FULL_SCAN_ALLOWED.items():
+        if allowed_endpoint == endpoint and re.fullmatch(pattern, statement):
+            return reason
+    return None
+
+
+def uncovered_endpoints(app):
+    """Registered views neither replayed nor declared query-free"""
+    replayed = {endpoint for endpoint, *_ in ROUTE_CALLS}
+    return sorted(set(app.view_functions) - replayed - NO_QUERY_ENDPOINTS)
+
+
+def analyse(app, drop_indexes=()):
+    """Seed a database, replay the routes and explain every query
+
+    drop_indexes removes indexes after seeding, to exercise the advisor.
+    """
+    with app.app_context():
+        admin_id = seed_database()
+        for name in drop_indexes:
+            db.session.execute(db.text(f'DROP INDEX {name}'))
+        db.session.commit()
+    captured = capture_route_queries(app, admin_id)
+
+    results = []
+    seen = set()
+    with app.app_context():
+        for endpoint, statement, parameters in captured:
+            if (endpoint, statement) in seen:
+                continue
+            seen.add((endpoint, statement))
+            plan = explain(statement, parameters)
+            scans = full_scans(statement, plan)
+            normalised = ' '.join(statement.split())
+            results.append({
+                'endpoint': endpoint,
+                'statement': normalised,
+                'plan': plan,
+                'full_scans': scans,
+                'allowed': allowed_reason(endpoint, normalised) if scans else None,
+                'suggestions': [(table, suggest_index(statement, table)) for table in scans]
+            })
+    return results
+
+
+def index_suggestions(results):
+    """Distinct suggested indexes, dropping those covered by a longer one"""
+    suggestions = {}
+    for result in results:
+        if result['allowed']:
+            continue
+        for table, columns in result['suggestions']:
+            if columns:
+                suggestions.setdefault((table, columns), result['endpoint'])
+
+    return {
+        (table, columns): endpoint
+        for (table, columns), endpoint in suggestions.items()
+        if not any(
+            other_table == table and len(other) > len(columns) and other[:len(columns)] == columns
+            for other_table, other in suggestions
+        )
+    }
+
+
+def index_names(inspector, table_name):
+    """Names of the indexes on a table, including expression indexes"""
+    if db.engine.dialect.name == 'sqlite':
+        # SQLite reflection skips expression indexes; read the catalogue instead
+        rows = db.session.execute(
+            db.text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :table"),
+            {'table': table_name}
+        )
+        return {row[0] for row in rows}
+    return {ix['name'] for ix in inspector.get_indexes(table_name)}
+
+
+def missing_indexes():
+    """Indexes declared on the models but absent from the current database"""
+    inspector = inspect(db.engine)
+    existing_tables = set(inspector.get_table_names())
+    missing = []
+    for table in db.metadata.sorted_tables:
+        if table.name in existing_tables:
+            present = index_names(inspector, table.name)
+            missing.extend(ix for ix in table.indexes if ix.name not in present)
+    return missing
+
+
+def print_result(status, result):
+    click.echo(f"[{status}] {result['endpoint']}")
+    click.echo(f"    {result['statement']}")
+    for detail in result['plan']:
+        click.echo(f'      {detail}')
+
+
+def register_commands(app):
+    """Register the query-plan CLI commands"""
+
+    @app.cli.command('check-query-plans')
+    def check_query_plans():
+        """Fail if a route query falls back to a full table scan"""
+        from app import create_app
+
+        ok = True
+        uncovered = uncovered_endpoints(app)
+        if uncovered:
+            ok = False
+            click.echo('✗ Endpoints missing from ROUTE_CALLS / NO_QUERY_ENDPOINTS:')
+            for endpoint in uncovered:
+                click.echo(f'    {endpoint}')
+
+        failures = [
+            result for result in analyse(create_app(QueryPlanConfig))
+            if result['full_scans'] and not result['allowed']
+        ]
+        for result in failures:
+            ok = False
+            print_result(f"FULL SCAN of {', '.join(result['full_scans'])}", result)
+
+        # Drop an index the routes need and make sure the advisor notices
+        dropped, expected = ADVISOR_SELF_TEST
+        suggestions = index_suggestions(analyse(create_app(QueryPlanConfig), drop_indexes=[dropped]))
+        if expected not in suggestions:
+            ok = False
+            click.echo(f"✗ Advisor did not suggest {expected[0]} ({', '.join(expected[1])}) without {dropped}")
+
+        if not ok:
+            sys.exit(1)
+        click.echo('✓ All endpoints covered, no unexpected full table scans, advisor self-test passed')
+
+    @app.cli.command('index-report')
+    def index_report():
+        """Show query plans, suggest indexes and list unapplied ones"""
+        from app import create_app
+
+        results = analyse(create_app(QueryPlanConfig))
+        for result in results:
+            if result['allowed']:
+                print_result(f"allowed: {result['allowed']}", result)
+            elif result['full_scans']:
+                print_result('FULL SCAN', result)
+            else:
+                print_result('ok', result)
+
+        click.echo('')
+        suggestions = index_suggestions(results)
+        if suggestions:
+            click.echo('Suggested indexes:')
+            for (table, columns), endpoint in suggestions.items():
+                click.echo(f"  {table} ({', '.join(columns)})  <- {endpoint}")
+        else:
+            click.echo('No index suggestions')
+
+        uncovered = uncovered_endpoints(app)
+        if uncovered:
+            click.echo(f"Endpoints not replayed: {', '.join(uncovered)}")
+
+        with app.app_context():
+            missing = missing_indexes()
+        if missing:
+            click.echo('Declared indexes missing from the database (created on next start):')
+            for index in missing:
+                click.echo(f'  {index.name} on {index.table.name}')
@@ -2,9 +2,12 @@
 Admin routes - Protected admin dashboard and game management
 """
 
-from flask import Blueprint, render_template, request, redirect, url_for, session, jsonify, flash
+from flask import Blueprint, render_template, request, redirect, url_for, session, jsonify, flash, Response, current_app
 from models import db, Admin, Game, GameRequest
+from events import broker, format_sse
+from cache import game_cache
 from functools import wraps
+import time
 
 admin_bp = Blueprint('admin', __name__)
 
@@ -60,6 +63,9 @@ def dashboard():
     
     admin_id = session.get('admin_id')
     
+    # Taken before the queries so the live stream replays anything newer
+    events_cursor = broker.cursor()
+    
     # Get admin's games
     games_pagination = Game.query.filter_by(admin_id=admin_id).order_by(
         Game.created_at.desc()
@@ -80,7 +86,8 @@ def dashboard():
         game_requests=requests,
         total_downloads=total_downloads,
         total_games=games_pagination.total,
-        total_requests=GameRequest.query.count()
+        total_requests=GameRequest.query.count(),
+        events_cursor=events_cursor
     )
 
 
@@ -122,6 +129,7 @@ def add_game():
         
         db.session.add(game)
         db.session.commit()
+        game_cache.invalidate(game.id)
         
         return jsonify({
             'success': True,
@@ -159,6 +167,7 @@ def update_game(game_id):
             game.download_link = data['download_link'].strip()
         
         db.session.commit()
+        game_cache.invalidate(game_id)
         
         return jsonify({
             'success': True,
@@ -185,6 +194,7 @@ def delete_game(game_id):
         title = game.title
         db.session.delete(game)
         db.session.commit()
+        game_cache.invalidate(game_id)
         
         return jsonify({
             'success': True,
@@ -210,6 +220,7 @@ def update_request(request_id):
         
         game_request.status = status
         db.session.commit()
+        broker.publish('request_status', game_request.to_dict())
         
         return jsonify({
             'success': True,
@@ -219,4 +230,59 @@ def update_request(request_id):
         
     except Exception as e:
         db.session.rollback()
-        return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
\ No newline at end of file
+        return jsonify({'success': False, 'message': f'Error: {str(e)}'}), 500
+
+
+@admin_bp.route('/api/cache/stats', methods=['GET'])
+@login_required
+def cache_stats():
+    """Game detail cache statistics"""
+    return jsonify({'success': True, 'game_cache': game_cache.stats()}), 200
+
+
+@admin_bp.route('/events')
+@login_required
+def events():
+    """Server-Sent Events stream of live dashboard updates
+    
+    Streams are closed after ADMIN_EVENTS_MAX_AGE seconds and the browser
+    reconnects on its own, so a worker thread is never held indefinitely.
+    Each event carries an id; the reconnect sends it back as Last-Event-ID
+    and the stream replays everything published since. If those events are
+    gone (buffer overrun, restart, another worker) a resync event tells the
+    page to reload.
+    """
+    config = current_app.config
+    admin_id = session.get('admin_id')
+    # The first connect passes the cursor the dashboard was rendered at
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    
+    def stream():
+        # Reserve the slot only once the stream runs, so nothing leaks if it never starts
+        if not broker.subscribe(config['ADMIN_EVENTS_MAX_SUBSCRIBERS']):
+            yield format_sse(event='busy', data={})
+            return
+        try:
+            yield format_sse(comment='connected', retry=config['ADMIN_EVENTS_RETRY'] * 1000)
+            seq = broker.parse_event_id(last_event_id)
+            if seq is None:
+                yield format_sse(event='resync', data={})
+                return
+            
+            deadline = time.monotonic() + config['ADMIN_EVENTS_MAX_AGE']
+            while time.monotonic() < deadline:
+                pending, seq, gap = broker.events_after(seq, admin_id, config['ADMIN_EVENTS_HEARTBEAT'])
+                if gap:
+                    yield format_sse(event='resync', data={})
+                    return
+                if not pending:
+                    yield format_sse(comment='heartbeat')
+                for event_seq, event, data in pending:
+                    yield format_sse(event=event, data=data, event_id=broker.event_id(event_seq))
+        finally:
+            broker.unsubscribe()
+    
+    return Response(stream(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
@@ -2,8 +2,10 @@
 API routes - RESTful API endpoints
 """
 
-from flask import Blueprint, request, jsonify
-from models import db, Game, GameRequest
+from flask import Blueprint, request, jsonify, abort
+from models import db, Game, GameRequest, GameChange
+from events import broker
+from cache import game_cache, get_game_payload
 
 api_bp = Blueprint('api', __name__)
 
@@ -32,16 +34,75 @@ def get_games():
     }), 200
 
 
+@api_bp.route('/games/changes', methods=['GET'])
+def get_game_changes():
+    """Get catalogue changes after a sequence token
+    
+    Inserts and updates carry the current game; deletes are tombstones with
+    ``game`` set to null. Clients store ``next_since`` and keep polling while
+    ``has_more`` is true. ``since=0`` returns the full live catalogue.
+    Sequence numbers are committed in order, so no change is ever skipped
+    by resuming from ``next_since``.
+    Download counts alone never produce a change; ``game.downloads`` is the
+    count at read time.
+    """
+    since = request.args.get('since', '0')
+    limit = request.args.get('limit', '100')
+    
+    # A bad token must not silently fall back to a full resync
+    if not (since.isascii() and since.isdigit()):
+        return jsonify({'success': False, 'message': 'Invalid since token'}), 400
+    if not (limit.isascii() and limit.isdigit()):
+        return jsonify({'success': False, 'message': 'Invalid limit'}), 400
+    
+    since = int(since)
+    limit = min(max(int(limit), 1), 500)
+    
+    changes = GameChange.query.filter(GameChange.id > since).order_by(
+        GameChange.id
+    ).limit(limit + 1).all()
+    
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+    
+    # Load every game referenced by an upsert in one query
+    upsert_ids = [c.game_id for c in changes if c.operation != 'delete']
+    games = {}
+    if upsert_ids:
+        games = {g.id: g for g in Game.query.filter(Game.id.in_(upsert_ids)).all()}
+    
+    return jsonify({
+        'changes': [c.to_dict(games.get(c.game_id)) for c in changes],
+        'next_since': changes[-1].id if changes else since,
+        'has_more': has_more
+    }), 200
+
+
 @api_bp.route('/games/<int:game_id>', methods=['GET'])
 def get_game_detail(game_id):
     """Get single game details"""
-    game = Game.query.get_or_404(game_id)
+    payload = get_game_payload(game_id)
+    if payload is None:
+        abort(404)
     
-    # Increment download counter
-    game.downloads += 1
+    # Increment download counter in place; the cached static fields stay valid.
+    # Download counts are not catalogue changes, so updated_at and the change
+    # feed are left alone.
+    row = db.session.execute(
+        db.update(Game).where(Game.id == game_id)
+        .values(downloads=Game.downloads + 1, updated_at=Game.updated_at)
+        .returning(Game.downloads, Game.admin_id)
+    ).first()
+    if row is None:
+        db.session.rollback()
+        game_cache.invalidate(game_id)
+        abort(404)
     db.session.commit()
     
-    return jsonify(game.to_dict()), 200
+    game_cache.set_downloads(game_id, row.downloads)
+    broker.publish_downloads(game_id, row.admin_id, row.downloads)
+    
+    return jsonify({**payload, 'downloads': row.downloads}), 200
 
 
 @api_bp.route('/genres', methods=['GET'])
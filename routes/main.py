@@ -2,8 +2,10 @@
 Main routes - Public routes for landing page and game search
 """
 
-from flask import Blueprint, render_template, request, jsonify
+from flask import Blueprint, render_template, request, jsonify, abort
 from models import db, Game, GameRequest
+from events import broker
+from cache import get_game_payload
 from sqlalchemy import func
 import re
 
@@ -43,11 +45,16 @@ def search():
     return jsonify({'results': results})
 
 
-@main_bp.route('/api/games/<int:game_id>')
+@main_bp.route('/games/<int:game_id>')
 def get_game(game_id):
-    """Get game details"""
-    game = Game.query.get_or_404(game_id)
-    return jsonify(game.to_dict())
+    """Get game details without counting a download
+    
+    /api/games/<id> (api.get_game_detail) is the counted download lookup.
+    """
+    payload = get_game_payload(game_id)
+    if payload is None:
+        abort(404)
+    return jsonify(payload)
 
 
 @main_bp.route('/request-game', methods=['POST'])
@@ -97,6 +104,7 @@ def request_game():
         
         db.session.add(game_request)
         db.session.commit()
+        broker.publish('request_created', game_request.to_dict())
         
         return jsonify({
             'success': True,
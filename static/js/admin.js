@@ -176,4 +176,158 @@ document.addEventListener('keydown', (e) => {
             modal.classList.remove('active');
         });
     }
-});
\ No newline at end of file
+});
+
+/* ============================================
+   LIVE DASHBOARD UPDATES (Server-Sent Events)
+   ============================================ */
+
+/**
+ * Add a delta to every element showing a live counter
+ */
+function bumpLiveCounter(name, delta) {
+    document.querySelectorAll(`[data-live="${name}"]`).forEach(el => {
+        el.textContent = (parseInt(el.textContent, 10) || 0) + delta;
+    });
+}
+
+/**
+ * Build a requests table row for a newly submitted request
+ */
+function buildRequestRow(req) {
+    const row = document.createElement('tr');
+    row.className = `status-${req.status}`;
+    row.dataset.requestId = req.id;
+
+    const title = document.createElement('td');
+    title.textContent = req.game_title;
+
+    const email = document.createElement('td');
+    email.textContent = req.user_email || 'Anonymous';
+
+    const status = document.createElement('td');
+    const badge = document.createElement('span');
+    badge.className = `status-badge status-${req.status}`;
+    badge.textContent = req.status.charAt(0).toUpperCase() + req.status.slice(1);
+    status.appendChild(badge);
+
+    const created = document.createElement('td');
+    created.textContent = req.created_at.slice(0, 16).replace('T', ' ');
+
+    const actions = document.createElement('td');
+    const select = document.createElement('select');
+    select.className = 'request-status';
+    ['pending', 'added', 'rejected'].forEach(value => {
+        const option = document.createElement('option');
+        option.value = value;
+        option.textContent = value.charAt(0).toUpperCase() + value.slice(1);
+        option.selected = value === req.status;
+        select.appendChild(option);
+    });
+    select.addEventListener('change', () => updateRequestStatus(req.id, select.value));
+    actions.appendChild(select);
+
+    row.append(title, email, status, created, actions);
+    return row;
+}
+
+/**
+ * Apply a new game request pushed by the server
+ */
+function handleRequestCreated(req) {
+    // Already rendered with the page
+    if (document.querySelector(`tr[data-request-id="${req.id}"]`)) {
+        return;
+    }
+
+    const tbody = document.getElementById('requests-tbody');
+    if (tbody) {
+        const emptyRow = tbody.querySelector('.empty-row');
+        if (emptyRow) {
+            emptyRow.remove();
+        }
+        tbody.prepend(buildRequestRow(req));
+    }
+
+    bumpLiveCounter('total-requests', 1);
+    if (req.status === 'pending') {
+        bumpLiveCounter('pending-requests', 1);
+    }
+    showToast(`New request: ${req.game_title}`, 'info');
+}
+
+/**
+ * Apply a request status change pushed by the server
+ */
+function handleRequestStatus(req) {
+    const row = document.querySelector(`tr[data-request-id="${req.id}"]`);
+    if (!row) {
+        return;
+    }
+
+    const badge = row.querySelector('.status-badge');
+    const previous = row.className.replace('status-', '');
+    if (previous === req.status) {
+        return;
+    }
+
+    if (previous === 'pending') {
+        bumpLiveCounter('pending-requests', -1);
+    } else if (req.status === 'pending') {
+        bumpLiveCounter('pending-requests', 1);
+    }
+
+    row.className = `status-${req.status}`;
+    badge.className = `status-badge status-${req.status}`;
+    badge.textContent = req.status.charAt(0).toUpperCase() + req.status.slice(1);
+    row.querySelector('.request-status').value = req.status;
+}
+
+/**
+ * Apply coalesced download-count deltas pushed by the server
+ */
+function handleDownloads(payload) {
+    let total = 0;
+    payload.games.forEach(game => {
+        total += game.delta;
+        const cell = document.querySelector(`tr[data-game-id="${game.id}"] .game-downloads`);
+        if (cell) {
+            cell.textContent = game.downloads;
+        }
+    });
+    bumpLiveCounter('total-downloads', total);
+}
+
+/**
+ * Subscribe to live dashboard events
+ *
+ * The first connect resumes from the cursor the page was rendered at;
+ * reconnects resume from the last received event id.
+ */
+function connectLiveUpdates() {
+    const content = document.querySelector('[data-events-cursor]');
+    if (!window.EventSource || !content) {
+        return;
+    }
+
+    const cursor = encodeURIComponent(content.dataset.eventsCursor);
+    const source = new EventSource(`/admin/events?last_event_id=${cursor}`);
+    // Missed events can no longer be replayed; reload for fresh aggregates,
+    // but at most once a minute so a stream from another process can't loop
+    source.addEventListener('resync', () => {
+        const lastReload = Number(sessionStorage.getItem('liveResyncAt') || 0);
+        if (Date.now() - lastReload < 60000) {
+            source.close();
+            return;
+        }
+        sessionStorage.setItem('liveResyncAt', String(Date.now()));
+        location.reload();
+    });
+    // Too many live connections; keep the page static
+    source.addEventListener('busy', () => source.close());
+    source.addEventListener('request_created', e => handleRequestCreated(JSON.parse(e.data)));
+    source.addEventListener('request_status', e => handleRequestStatus(JSON.parse(e.data)));
+    source.addEventListener('downloads', e => handleDownloads(JSON.parse(e.data)));
+}
+
+connectLiveUpdates();